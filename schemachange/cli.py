@@ -9,7 +9,6 @@ from schemachange.config.RenderConfig import RenderConfig
 from schemachange.config.get_merged_config import get_merged_config
 from schemachange.deploy import deploy
 from schemachange.redact_config_secrets import redact_config_secrets
-from schemachange.session.SnowflakeSession import SnowflakeSession
 
 # region Global Variables
 # metadata
@@ -62,6 +61,10 @@ def main():
             logger=logger,
         )
     else:
+        # snowflake.connector (and the cryptography/requests stack behind it) is slow to import and
+        # only needed to deploy, so keep it off the render path
+        from schemachange.session.SnowflakeSession import SnowflakeSession
+
         session = SnowflakeSession(
             schemachange_version=SCHEMACHANGE_VERSION,
             application=SNOWFLAKE_APPLICATION_NAME,
@@ -10,16 +10,20 @@ from schemachange.config.RenderConfig import RenderConfig
 from schemachange.config.parse_cli_args import parse_cli_args
 from schemachange.config.utils import (
     load_yaml_config,
+    validate_config_vars,
     validate_directory,
     validate_file_path,
 )
 
+subcommand_config_classes = {
+    "deploy": DeployConfig,
+    "render": RenderConfig,
+}
+
 
 def get_yaml_config_kwargs(config_file_path: Optional[Path]) -> dict:
-    # load YAML inputs and convert kebabs to snakes
-    kwargs = {
-        k.replace("-", "_"): v for (k, v) in load_yaml_config(config_file_path).items()
-    }
+    # load YAML inputs, converting kebabs to snakes as they're parsed
+    kwargs = load_yaml_config(config_file_path, snake_case_keys=True)
 
     if "verbose" in kwargs:
         if kwargs["verbose"]:
@@ -51,7 +55,7 @@ def get_merged_config(
     cli_kwargs = parse_cli_args(sys.argv[1:])
     logger.debug("cli_kwargs", **cli_kwargs)
 
-    cli_config_vars = cli_kwargs.pop("config_vars")
+    cli_config_vars = validate_config_vars(cli_kwargs.pop("config_vars"))
 
     connections_file_path = validate_file_path(
         file_path=cli_kwargs.pop("connections_file_path", None)
@@ -61,16 +65,14 @@ def get_merged_config(
 
     config_folder = validate_directory(path=cli_kwargs.pop("config_folder", "."))
     config_file_name = cli_kwargs.pop("config_file_name")
-    config_file_path = Path(config_folder) / config_file_name
+    config_file_path = config_folder / config_file_name
 
     yaml_kwargs = get_yaml_config_kwargs(
         config_file_path=config_file_path,
     )
     logger.debug("yaml_kwargs", **yaml_kwargs)
 
-    yaml_config_vars = yaml_kwargs.pop("config_vars", None)
-    if yaml_config_vars is None:
-        yaml_config_vars = {}
+    yaml_config_vars = validate_config_vars(yaml_kwargs.pop("config_vars", None))
 
     if connections_file_path is None:
         connections_file_path = yaml_kwargs.pop("connections_file_path", None)
@@ -83,18 +85,26 @@ def get_merged_config(
     if connection_name is None:
         connection_name = yaml_kwargs.pop("connection_name", None)
 
-    config_vars = {
-        **yaml_config_vars,
-        **cli_config_vars,
-    }
+    # Both sides are validated dicts, freshly built for this call, so when one is empty the other
+    # can be used as-is
+    if not yaml_config_vars:
+        config_vars = cli_config_vars
+    elif not cli_config_vars:
+        config_vars = yaml_config_vars
+    else:
+        config_vars = {
+            **yaml_config_vars,
+            **cli_config_vars,
+        }
 
-    # override the YAML config with the CLI configuration
+    # override the YAML config with the CLI configuration. Neither get_yaml_config_kwargs nor
+    # parse_cli_args return None values, so an absent setting never masks one from the other source.
     kwargs = {
         "config_file_path": config_file_path,
         "config_vars": config_vars,
-        **{k: v for k, v in yaml_kwargs.items() if v is not None},
-        **{k: v for k, v in cli_kwargs.items() if v is not None},
     }
+    kwargs.update(yaml_kwargs)
+    kwargs.update(cli_kwargs)
     if connections_file_path is not None:
         kwargs["connections_file_path"] = connections_file_path
     if connection_name is not None:
@@ -102,9 +112,8 @@ def get_merged_config(
 
     logger.debug("final kwargs", **kwargs)
 
-    if cli_kwargs["subcommand"] == "deploy":
-        return DeployConfig.factory(**kwargs)
-    elif cli_kwargs["subcommand"] == "render":
-        return RenderConfig.factory(**kwargs)
-    else:
-        raise Exception(f"unhandled subcommand: {cli_kwargs['subcommand'] }")
+    try:
+        config_class = subcommand_config_classes[cli_kwargs["subcommand"]]
+    except KeyError:
+        raise Exception(f"unhandled subcommand: {cli_kwargs['subcommand'] }") from None
+    return config_class.factory(**kwargs)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
 import sys
@@ -13,7 +14,6 @@ logger = structlog.getLogger(__name__)
 
 class DeprecateConnectionArgAction(argparse.Action):
     def __init__(self, *args, **kwargs):
-        self.call_count = 0
         if "help" in kwargs:
             kwargs["help"] = (
                 f'[DEPRECATED - Set in connections.toml instead.] {kwargs["help"]}'
@@ -21,12 +21,12 @@ class DeprecateConnectionArgAction(argparse.Action):
         super().__init__(*args, **kwargs)
 
     def __call__(self, parser, namespace, values, option_string=None):
-        if self.call_count == 0:
+        # The parser is reused across calls, so track repeats on the namespace rather than the action
+        if getattr(namespace, self.dest, None) is None:
             sys.stderr.write(
                 f"{', '.join(self.option_strings)} is deprecated. It will be ignored in future versions.\n"
             )
             sys.stderr.write(self.help + "\n")
-        self.call_count += 1
         setattr(namespace, self.dest, values)
 
 
@@ -62,7 +62,8 @@ class EnumAction(argparse.Action):
         setattr(namespace, self.dest, value)
 
 
-def parse_cli_args(args) -> dict:
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="schemachange",
         description="Apply schema changes to a Snowflake account. Full readme at "
@@ -230,6 +231,12 @@ def parse_cli_args(args) -> dict:
         "script_path", type=str, help="Path to the script to render"
     )
 
+    return parser
+
+
+def parse_cli_args(args) -> dict:
+    parser = build_parser()
+
     # The original parameters did not support subcommands. Check if a subcommand has been supplied
     # if not default to deploy to match original behaviour.
     if len(args) == 0 or not any(
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import collections.abc
+import errno
+import functools
 import os
 import re
+import stat
 from pathlib import Path
 from typing import Any
 
@@ -13,10 +17,18 @@ import yaml
 from schemachange.JinjaEnvVar import JinjaEnvVar
 import warnings
 
+try:
+    # Prefer the libyaml bindings, which are much faster than the pure-Python loader
+    from yaml import CFullLoader as FullLoader
+except ImportError:
+    from yaml import FullLoader
+
 logger = structlog.getLogger(__name__)
 
 snowflake_identifier_pattern = re.compile(r"^[\w]+$")
 
+ignored_stat_errnos = (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP)
+
 
 def get_snowflake_identifier_string(input_value: str, input_type: str) -> str | None:
     # Words with alphanumeric characters and underscores only.
@@ -108,27 +120,92 @@ def validate_config_vars(config_vars: str | dict | None) -> dict:
     return config_vars
 
 
-def load_yaml_config(config_file_path: Path | None) -> dict[str, Any]:
+@functools.lru_cache(maxsize=8)
+def _get_config_template(
+    config_file_path: Path, st_mtime_ns: int, st_size: int
+) -> jinja2.Template:
     """
-    Loads the schemachange config file and processes with jinja templating engine
+    Compiles the config file into a jinja template. Keyed on the file's mtime and size so an edited
+    config file is recompiled.
+
+    A CLI run loads its config file once, so this only saves work when the same file is loaded
+    repeatedly in one process, e.g. across a test session.
     """
-    config = dict()
+    # The config file does not have the same access to the jinja functionality that a script
+    # has.
+    return jinja2.Template(
+        config_file_path.read_text(),
+        undefined=jinja2.StrictUndefined,
+        extensions=[JinjaEnvVar],
+    )
 
-    # First read in the yaml config file, if present
-    if config_file_path is not None and config_file_path.is_file():
-        with config_file_path.open() as config_file:
-            # Run the config file through the jinja engine to give access to environmental variables
-            # The config file does not have the same access to the jinja functionality that a script
-            # has.
-            config_template = jinja2.Template(
-                config_file.read(),
-                undefined=jinja2.StrictUndefined,
-                extensions=[JinjaEnvVar],
-            )
 
-            # The FullLoader parameter handles the conversion from YAML scalar values to Python the dictionary format
-            config = yaml.load(config_template.render(), Loader=yaml.FullLoader)
-        logger.info("Using config file", config_file_path=str(config_file_path))
+class SnakeCaseKeysLoader(FullLoader):
+    """
+    Converts the top-level kebab-case keys of the config file to snake case as they're constructed,
+    rather than in a second pass over the parsed dict. Nested mappings, such as the user-supplied
+    vars, are left untouched.
+    """
+
+    def construct_document(self, node):
+        self.document_node = node
+        return super().construct_document(node)
+
+    def construct_mapping(self, node, deep=False):
+        if node is not self.document_node:
+            return super().construct_mapping(node, deep=deep)
+
+        # Expand merge keys (<<) first so that merged-in keys are converted too
+        self.flatten_mapping(node)
+        mapping = {}
+        for key_node, value_node in node.value:
+            key = self.construct_object(key_node, deep=deep)
+            if isinstance(key, str):
+                key = key.replace("-", "_")
+            elif not isinstance(key, collections.abc.Hashable):
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping",
+                    node.start_mark,
+                    "found unhashable key",
+                    key_node.start_mark,
+                )
+            mapping[key] = self.construct_object(value_node, deep=deep)
+        return mapping
+
+
+def load_yaml_config(
+    config_file_path: Path | None, snake_case_keys: bool = False
+) -> dict[str, Any]:
+    """
+    Loads the schemachange config file and processes with jinja templating engine
+
+    When snake_case_keys is set, top-level keys are returned in snake case
+    """
+    config = dict()
+    if config_file_path is None:
+        return config
+
+    # First read in the yaml config file, if present. A single stat both checks for the file and
+    # keys the template cache.
+    try:
+        config_stat = config_file_path.stat()
+    except OSError as e:
+        # Mirror Path.is_file(), which treats only these errors as "no such file"
+        if e.errno not in ignored_stat_errnos:
+            raise
+        return config
+    if not stat.S_ISREG(config_stat.st_mode):
+        return config
+
+    # Run the config file through the jinja engine to give access to environmental variables
+    config_template = _get_config_template(
+        config_file_path, config_stat.st_mtime_ns, config_stat.st_size
+    )
+
+    # The FullLoader parameter handles the conversion from YAML scalar values to Python the dictionary format
+    loader = SnakeCaseKeysLoader if snake_case_keys else FullLoader
+    config = yaml.load(config_template.render(), Loader=loader)
+    logger.info("Using config file", config_file_path=str(config_file_path))
     return config
 
 
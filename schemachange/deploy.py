@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import hashlib
 import re
+from typing import TYPE_CHECKING
 
 import structlog
 
 from schemachange.JinjaTemplateProcessor import JinjaTemplateProcessor
 from schemachange.config.DeployConfig import DeployConfig
 from schemachange.session.Script import get_all_scripts_recursively
-from schemachange.session.SnowflakeSession import SnowflakeSession
+
+if TYPE_CHECKING:
+    from schemachange.session.SnowflakeSession import SnowflakeSession
 
 logger = structlog.getLogger(__name__)
 
@@ -302,6 +302,43 @@ def test_invalid_config_folder(mock_parse_cli_args, _):
     )
 
 
+@mock.patch("pathlib.Path.is_dir", return_value=True)
+@mock.patch("schemachange.config.get_merged_config.parse_cli_args")
+@mock.patch("schemachange.config.get_merged_config.get_yaml_config_kwargs")
+def test_unhandled_subcommand(mock_get_yaml_config_kwargs, mock_parse_cli_args, _):
+    mock_parse_cli_args.return_value = {**default_cli_kwargs, "subcommand": "undeploy"}
+    mock_get_yaml_config_kwargs.return_value = {}
+    logger = structlog.testing.CapturingLogger()
+    with pytest.raises(Exception) as e_info:
+        # noinspection PyTypeChecker
+        get_merged_config(logger=logger)
+    assert str(e_info.value) == "unhandled subcommand: undeploy"
+
+
+@pytest.mark.parametrize("yaml_config_vars", [[], ""])
+@pytest.mark.parametrize("cli_config_vars", [{}, {"var1": "from_cli"}])
+@mock.patch("pathlib.Path.is_dir", return_value=True)
+@mock.patch("schemachange.config.get_merged_config.parse_cli_args")
+@mock.patch("schemachange.config.get_merged_config.get_yaml_config_kwargs")
+def test_malformed_yaml_config_vars(
+    mock_get_yaml_config_kwargs,
+    mock_parse_cli_args,
+    _,
+    cli_config_vars,
+    yaml_config_vars,
+):
+    mock_parse_cli_args.return_value = {
+        **default_cli_kwargs,
+        "config_vars": cli_config_vars,
+    }
+    mock_get_yaml_config_kwargs.return_value = {"config_vars": yaml_config_vars}
+    logger = structlog.testing.CapturingLogger()
+    with pytest.raises(ValueError) as e_info:
+        # noinspection PyTypeChecker
+        get_merged_config(logger=logger)
+    assert "config_vars did not parse correctly" in str(e_info.value)
+
+
 param_only_required_cli_arguments = pytest.param(
     [  # cli_args
         "schemachange",
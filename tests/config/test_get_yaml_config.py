@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import errno
 import os
 import unittest.mock as mock
 from pathlib import Path
@@ -94,3 +95,126 @@ def test_get_yaml_config(_):
     assert yaml_config["dry_run"] is False
 
     assert yaml_config["config_vars"] == {"var1": "from_yaml", "var2": "also_from_yaml"}
+
+
+def test_load_yaml_config__modified_config_file_should_be_reloaded(tmp_path: Path):
+    config_file = tmp_path / "schemachange-config.yml"
+    config_file.write_text("root-folder: scripts\n")
+    assert load_yaml_config(config_file)["root-folder"] == "scripts"
+
+    config_file.write_text("root-folder: other-scripts\n")
+    os.utime(config_file, ns=(0, 0))
+    assert load_yaml_config(config_file)["root-folder"] == "other-scripts"
+
+
+def test_load_yaml_config__mutating_result_should_not_affect_later_loads(
+    tmp_path: Path,
+):
+    config_file = tmp_path / "schemachange-config.yml"
+    config_file.write_text("vars:\n  database_name: SCHEMACHANGE_DEMO_JINJA\n")
+
+    config = load_yaml_config(config_file)
+    config["vars"]["database_name"] = "mutated"
+
+    assert load_yaml_config(config_file)["vars"]["database_name"] == (
+        "SCHEMACHANGE_DEMO_JINJA"
+    )
+
+
+def test_load_yaml_config__snake_case_keys_should_only_rename_top_level_keys(
+    tmp_path: Path,
+):
+    config_contents = """
+config-version: 1
+root-folder: scripts
+vars:
+  database-name: SCHEMACHANGE_DEMO_JINJA
+"""
+    config_file = tmp_path / "schemachange-config.yml"
+    config_file.write_text(config_contents)
+
+    config = load_yaml_config(config_file, snake_case_keys=True)
+
+    assert config == {
+        "config_version": 1,
+        "root_folder": "scripts",
+        "vars": {"database-name": "SCHEMACHANGE_DEMO_JINJA"},
+    }
+
+
+def test_load_yaml_config__missing_or_non_file_path_should_return_empty_config(
+    tmp_path: Path,
+):
+    assert load_yaml_config(None) == {}
+    assert load_yaml_config(tmp_path / "schemachange-config.yml") == {}
+    assert load_yaml_config(tmp_path) == {}
+
+
+def test_load_yaml_config__snake_case_keys_should_rename_merged_keys(
+    tmp_path: Path,
+):
+    config_contents = """
+defaults: &defaults
+  root-folder: from-anchor
+  modules-folder: modules
+<<: *defaults
+modules-folder: overridden
+"""
+    config_file = tmp_path / "schemachange-config.yml"
+    config_file.write_text(config_contents)
+
+    config = load_yaml_config(config_file, snake_case_keys=True)
+
+    assert config == {
+        "defaults": {"root-folder": "from-anchor", "modules-folder": "modules"},
+        "root_folder": "from-anchor",
+        "modules_folder": "overridden",
+    }
+
+
+def test_load_yaml_config__snake_case_keys_should_not_rename_aliased_key(
+    tmp_path: Path,
+):
+    config_contents = """
+&key root-folder: scripts
+vars:
+  *key : value
+"""
+    config_file = tmp_path / "schemachange-config.yml"
+    config_file.write_text(config_contents)
+
+    config = load_yaml_config(config_file, snake_case_keys=True)
+
+    assert config == {"root_folder": "scripts", "vars": {"root-folder": "value"}}
+
+
+def test_get_yaml_config__vars_should_take_precedence_over_config_vars(
+    tmp_path: Path,
+):
+    config_file = tmp_path / "schemachange-config.yml"
+    config_file.write_text("vars:\n  a: 1\nconfig-vars:\n  b: 2\n")
+
+    yaml_config = get_yaml_config_kwargs(config_file_path=config_file)
+
+    assert yaml_config["config_vars"] == {"a": 1}
+
+
+def test_load_yaml_config__stat_permission_error_should_raise(tmp_path: Path):
+    config_file = tmp_path / "schemachange-config.yml"
+    config_file.write_text("root-folder: scripts\n")
+
+    with mock.patch(
+        "pathlib.Path.stat",
+        side_effect=PermissionError(errno.EACCES, "Permission denied"),
+    ):
+        with pytest.raises(PermissionError):
+            load_yaml_config(config_file)
+
+
+def test_get_yaml_config__omits_empty_values(tmp_path: Path):
+    config_file = tmp_path / "schemachange-config.yml"
+    config_file.write_text("root-folder: scripts\nquery-tag:\n")
+
+    yaml_config = get_yaml_config_kwargs(config_file_path=config_file)
+
+    assert yaml_config == {"root_folder": "scripts"}
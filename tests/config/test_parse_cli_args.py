@@ -128,3 +128,15 @@ def test_parse_args_deploy_flags():
     assert parsed_args["subcommand"] == "deploy"
     for expected_arg, expected_value in expected.items():
         assert parsed_args[expected_arg] == expected_value
+
+
+def test_parse_args_deprecated_arg_warns_once_per_parse(capsys):
+    for _ in range(2):
+        parse_cli_args(["deploy", "-a", "account", "-a", "other-account"])
+        assert capsys.readouterr().err.count("is deprecated") == 1
+
+
+def test_parse_args_omits_unset_args():
+    parsed_args = parse_cli_args(["deploy"])
+    assert None not in parsed_args.values()
+    assert "snowflake_account" not in parsed_args
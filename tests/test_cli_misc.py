@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from dataclasses import asdict
 
 import pytest
@@ -19,6 +21,20 @@ def test_cli_given__constants_exist():
     assert SNOWFLAKE_APPLICATION_NAME == "schemachange"
 
 
+def test_cli_given__import_does_not_load_snowflake_connector():
+    # Run in a fresh interpreter; the test session has already imported the connector
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, schemachange.cli; "
+            "sys.exit('snowflake.connector' in sys.modules)",
+        ],
+        check=False,
+    )
+    assert result.returncode == 0
+
+
 def test_alphanum_convert_given__integer():
     assert alphanum_convert("123") == 123
 
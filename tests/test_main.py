@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import os
 import tempfile
 import unittest.mock as mock
 from dataclasses import asdict
@@ -69,11 +68,12 @@ required_config = {
 script_path = (
     Path(__file__).parent.parent / "demo" / "basics_demo" / "2_test" / "A__basic001.sql"
 )
+script_path_str = str(script_path)
 
 no_command = pytest.param(
     "schemachange.cli.deploy",
     ["schemachange", *required_args],
-    {**default_deploy_config, **required_config},
+    dict(default_deploy_config, **required_config),
     None,
     id="no command",
 )
@@ -81,7 +81,7 @@ no_command = pytest.param(
 deploy_only_required = pytest.param(
     "schemachange.cli.deploy",
     ["schemachange", "deploy", *required_args],
-    {**default_deploy_config, **required_config},
+    dict(default_deploy_config, **required_config),
     None,
     id="deploy: only required",
 )
@@ -336,13 +336,7 @@ deploy_snowflake_oauth_env_var = pytest.param(
         "deploy",
         *required_args,
     ],
-    {
-        **default_deploy_config,
-        "snowflake_account": "account",
-        "snowflake_user": "user",
-        "snowflake_warehouse": "warehouse",
-        "snowflake_role": "role",
-    },
+    dict(default_deploy_config, **required_config),
     None,
     id="deploy: oauth env var",
 )
@@ -354,13 +348,7 @@ deploy_snowflake_oauth_file = pytest.param(
         "deploy",
         *required_args,
     ],
-    {
-        **default_deploy_config,
-        "snowflake_account": "account",
-        "snowflake_user": "user",
-        "snowflake_warehouse": "warehouse",
-        "snowflake_role": "role",
-    },
+    dict(default_deploy_config, **required_config),
     None,
     id="deploy: oauth file",
 )
@@ -370,11 +358,11 @@ render_only_required = pytest.param(
     [
         "schemachange",
         "render",
-        str(script_path),
+        script_path_str,
         "--config-folder",
         str(assets_path),
     ],
-    {**default_base_config},
+    dict(default_base_config),
     script_path,
     id="render: only required",
 )
@@ -389,16 +377,16 @@ render_all_cli_arg_names = pytest.param(
         "--vars",
         '{"var1": "val"}',
         "--verbose",
-        str(script_path),
+        script_path_str,
         "--config-folder",
         str(assets_path),
     ],
-    {
-        **default_base_config,
-        "root_folder": Path("."),
-        "config_vars": {"var1": "val"},
-        "log_level": logging.DEBUG,
-    },
+    dict(
+        default_base_config,
+        root_folder=Path("."),
+        config_vars={"var1": "val"},
+        log_level=logging.DEBUG,
+    ),
     script_path,
     id="render: all cli argument names",
 )
@@ -445,6 +433,22 @@ def test_main_deploy_subcommand_given_arguments_make_sure_arguments_set_on_call(
                 assert call_kwargs["script_path"] == expected_script_path
 
 
+@pytest.fixture(scope="session")
+def config_folder(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    folder = tmp_path_factory.mktemp("config_folder")
+    (folder / "schemachange-config.yml").write_text(
+        dedent(
+            """
+            snowflake_account: account
+            snowflake_user: user
+            snowflake_warehouse: warehouse
+            snowflake_role: role
+            """
+        )
+    )
+    return folder
+
+
 @pytest.mark.parametrize(
     "to_mock, args,  expected_config, expected_script_path",
     [
@@ -456,13 +460,13 @@ def test_main_deploy_subcommand_given_arguments_make_sure_arguments_set_on_call(
                 "--config-folder",
                 "DUMMY",
             ],
-            {
-                **default_deploy_config,
-                "snowflake_user": "user",
-                "snowflake_warehouse": "warehouse",
-                "snowflake_role": "role",
-                "snowflake_account": "account",
-            },
+            dict(
+                default_deploy_config,
+                snowflake_user="user",
+                snowflake_warehouse="warehouse",
+                snowflake_role="role",
+                snowflake_account="account",
+            ),
             None,
         ),
         (
@@ -470,11 +474,11 @@ def test_main_deploy_subcommand_given_arguments_make_sure_arguments_set_on_call(
             [
                 "schemachange",
                 "render",
-                str(script_path),
+                script_path_str,
                 "--config-folder",
                 "DUMMY",
             ],
-            default_base_config,
+            dict(default_base_config),
             script_path,
         ),
     ],
@@ -488,37 +492,25 @@ def test_main_deploy_config_folder(
     args: list[str],
     expected_config: dict,
     expected_script_path: Path | None,
+    config_folder: Path,
 ):
-    with tempfile.TemporaryDirectory() as d:
-        with open(os.path.join(d, "schemachange-config.yml"), "w") as f:
-            f.write(
-                dedent(
-                    """
-                    snowflake_account: account
-                    snowflake_user: user
-                    snowflake_warehouse: warehouse
-                    snowflake_role: role
-                    """
-                )
-            )
-
-        # noinspection PyTypeChecker
-        args[args.index("DUMMY")] = d
-        expected_config["config_file_path"] = Path(d) / "schemachange-config.yml"
+    # noinspection PyTypeChecker
+    args[args.index("DUMMY")] = str(config_folder)
+    expected_config["config_file_path"] = config_folder / "schemachange-config.yml"
 
-        with mock.patch(to_mock) as mock_command:
-            with mock.patch("sys.argv", args):
-                cli.main()
-                mock_command.assert_called_once()
-                _, call_kwargs = mock_command.call_args
-                for expected_arg, expected_value in expected_config.items():
-                    actual_value = getattr(call_kwargs["config"], expected_arg)
-                    if hasattr(actual_value, "table_name"):
-                        assert asdict(actual_value) == asdict(expected_value)
-                    else:
-                        assert actual_value == expected_value
-                if expected_script_path is not None:
-                    assert call_kwargs["script_path"] == expected_script_path
+    with mock.patch(to_mock) as mock_command:
+        with mock.patch("sys.argv", args):
+            cli.main()
+            mock_command.assert_called_once()
+            _, call_kwargs = mock_command.call_args
+            for expected_arg, expected_value in expected_config.items():
+                actual_value = getattr(call_kwargs["config"], expected_arg)
+                if hasattr(actual_value, "table_name"):
+                    assert asdict(actual_value) == asdict(expected_value)
+                else:
+                    assert actual_value == expected_value
+            if expected_script_path is not None:
+                assert call_kwargs["script_path"] == expected_script_path
 
 
 @pytest.mark.parametrize(
@@ -527,7 +519,7 @@ def test_main_deploy_config_folder(
         (
             "schemachange.cli.deploy",
             ["schemachange", "deploy", *required_args, "--modules-folder", "DUMMY"],
-            {**default_deploy_config, **required_config, "modules_folder": "DUMMY"},
+            dict(default_deploy_config, **required_config, modules_folder="DUMMY"),
             None,
         ),
         (
@@ -535,13 +527,13 @@ def test_main_deploy_config_folder(
             [
                 "schemachange",
                 "render",
-                str(script_path),
+                script_path_str,
                 "--modules-folder",
                 "DUMMY",
                 "--config-folder",
                 str(assets_path),
             ],
-            {**default_base_config, "modules_folder": "DUMMY"},
+            dict(default_base_config, modules_folder="DUMMY"),
             script_path,
         ),
     ],